@@ -2,10 +2,13 @@
 
 import tkinter as tk
 from tkinter import ttk
+import array
+import bisect
 import json
 import math
+import re
+import socket
 import time
-from datetime import datetime
 from collections import deque
 
 try:
@@ -14,6 +17,16 @@ except ImportError:
     print("Warning: paho-mqtt not installed. Install with: pip install paho-mqtt")
     mqtt = None
 
+try:
+    import orjson
+    payload_loads = orjson.loads
+    payload_dumps = orjson.dumps
+except ImportError:
+    payload_loads = json.loads
+
+    def payload_dumps(data):
+        return json.dumps(data).encode()
+
 import platform
 
 THEME_BG = "#0b0c10"
@@ -48,17 +61,34 @@ MQTT_TOPIC_SENSORS = "truck/+/sensors"
 MQTT_TOPIC_STATE = "truck/+/state"
 MQTT_TOPIC_COMMANDS = "truck/{}/commands"
 MQTT_TOPIC_SETPOINT = "truck/{}/setpoint"
+MQTT_QUEUE_MAX_MESSAGES = 10000
 
 MAP_WIDTH_PIXELS = 1000
 MAP_HEIGHT_PIXELS = 700
+CANVAS_CULL_MARGIN_PIXELS = 30
 MAP_DISPLAY_SCALE = 1.5
+MAP_DISPLAY_INVERSE_SCALE = 1.0 / MAP_DISPLAY_SCALE
 GRID_SPACING_PIXELS = 100
+GRID_LINE_COLOR = '#1f2833'
+GRID_DASH_ON_PIXELS = 2
+GRID_DASH_OFF_PIXELS = 4
 
 TEMPERATURE_WARNING_THRESHOLD = 95
 TEMPERATURE_CRITICAL_THRESHOLD = 120
+FAULT_BIT_ELECTRICAL = 1
+FAULT_BIT_HYDRAULIC = 2
+FAULT_BIT_TEMPERATURE = 4
+FAULT_BIT_STATE = 8
 
 POSITION_HISTORY_SIZE = 20
 GUI_UPDATE_PERIOD_MS = 50
+GUI_IDLE_PERIOD_MS = 250
+INFO_PANEL_MIN_REDRAW_SECONDS = 0.2
+MANUAL_HEARTBEAT_PERIOD_MS = 300
+MANUAL_PUBLISH_STALL_SECONDS = MANUAL_HEARTBEAT_PERIOD_MS / 1000.0
+FPS_SMOOTHING_FACTOR = 0.9
+STATUS_LABEL_PERIOD_MS = 200
+MANUAL_COMMAND_FLUSH_MS = 20
 
 TRUCK_DISPLAY_SIZE = 15
 DIRECTION_INDICATOR_LENGTH = 20
@@ -66,43 +96,100 @@ WAYPOINT_DISPLAY_RADIUS = 8
 
 DEFAULT_TARGET_SPEED = 50
 
+REARM_COMMAND_PAYLOAD = payload_dumps({"rearm": True})
+AUTO_MODE_COMMAND_PAYLOAD = payload_dumps({"auto_mode": True, "manual_mode": False})
+MANUAL_MODE_COMMAND_PAYLOAD = payload_dumps({"auto_mode": False, "manual_mode": True})
+
+TRUCK_TOPIC_PATTERN = re.compile(r'^truck/(\d+)/(sensors|state|commands)$')
+
+COS_BY_DEGREE = array.array('d', (math.cos(math.radians(a)) for a in range(360)))
+SIN_BY_DEGREE = array.array('d', (math.sin(math.radians(a)) for a in range(360)))
+
+MANUAL_SPEED_STEP = 5
+MANUAL_STEER_STEP = 5
+KEY_SPEED_DELTAS = {
+    'Up': MANUAL_SPEED_STEP,
+    'w': MANUAL_SPEED_STEP,
+    'Down': -MANUAL_SPEED_STEP,
+    's': -MANUAL_SPEED_STEP,
+}
+KEY_STEER_COMMANDS = {
+    'Left': 'steer_left',
+    'a': 'steer_left',
+    'Right': 'steer_right',
+    'd': 'steer_right',
+}
+
 
 class TruckData:
+    __slots__ = ('id', 'label_plain', 'label_arrived', 'position_x', 'position_y',
+                 'angle', 'angle_cos', 'angle_sin', 'temperature',
+                 'fault_electrical', 'fault_hydraulic', 'mode', 'fault_state',
+                 'last_update', 'trail_canvas_coords', 'acceleration', 'steering',
+                 'arrived', 'dirty', 'pos_changed', 'display_category', 'fault_bits')
+
     def __init__(self, truck_id):
         self.id = truck_id
+        self.label_plain = f"TRUCK {truck_id}"
+        self.label_arrived = f"TRUCK {truck_id} ✓"
         self.position_x = 0
         self.position_y = 0
         self.angle = 0
+        self.angle_cos = 1.0
+        self.angle_sin = 0.0
         self.temperature = 0
         self.fault_electrical = False
         self.fault_hydraulic = False
         self.mode = "MANUAL"
         self.fault_state = False
-        self.last_update = None
-        self.position_history = deque(maxlen=POSITION_HISTORY_SIZE)
+        self.fault_bits = 0
+        self.last_update = 0.0
+        self.trail_canvas_coords = deque(maxlen=POSITION_HISTORY_SIZE * 2)
 
         self.acceleration = 0
         self.steering = 0
         self.arrived = False
-        
+
         self.dirty = True
+        self.pos_changed = True
+        self.display_category = 'manual'
 
     def update_sensors(self, data):
         self.position_x = data.get('position_x', 0)
         self.position_y = data.get('position_y', 0)
-        self.angle = data.get('angle_x', 0)
+
+        new_angle = data.get('angle_x', 0)
+        if new_angle != self.angle:
+            self.angle = new_angle
+            degree_index = int(new_angle) % 360
+            self.angle_cos = COS_BY_DEGREE[degree_index]
+            self.angle_sin = SIN_BY_DEGREE[degree_index]
+
         self.temperature = data.get('temperature', 0)
         self.fault_electrical = data.get('fault_electrical', False)
         self.fault_hydraulic = data.get('fault_hydraulic', False)
-        self.last_update = datetime.now()
-
-        self.position_history.append((self.position_x, self.position_y))
+        self.fault_bits = ((self.fault_bits & FAULT_BIT_STATE)
+                           | (FAULT_BIT_ELECTRICAL if self.fault_electrical else 0)
+                           | (FAULT_BIT_HYDRAULIC if self.fault_hydraulic else 0)
+                           | (FAULT_BIT_TEMPERATURE
+                              if self.temperature > TEMPERATURE_CRITICAL_THRESHOLD else 0))
+        self.refresh_display_category()
+        self.last_update = time.monotonic()
+
+        self.trail_canvas_coords.append(int(self.position_x * MAP_DISPLAY_INVERSE_SCALE))
+        self.trail_canvas_coords.append(int(self.position_y * MAP_DISPLAY_INVERSE_SCALE))
         self.dirty = True
+        self.pos_changed = True
 
     def update_state(self, data):
         self.mode = "AUTO" if data.get('automatic', False) else "MANUAL"
         self.fault_state = data.get('fault', False)
-        self.last_update = datetime.now()
+        if self.fault_state:
+            self.fault_bits |= FAULT_BIT_STATE
+        else:
+            self.fault_bits &= ~FAULT_BIT_STATE
+        self.refresh_display_category()
+        self.last_update = time.monotonic()
         self.dirty = True
 
     def update_commands(self, data):
@@ -112,26 +199,39 @@ class TruckData:
             self.steering = data['steering']
         if 'arrived' in data:
             self.arrived = data['arrived']
-        self.last_update = datetime.now()
+        self.last_update = time.monotonic()
         self.dirty = True
 
     def has_any_fault(self):
-        return (self.fault_state or
-                self.fault_electrical or
-                self.fault_hydraulic or
-                self.temperature > TEMPERATURE_CRITICAL_THRESHOLD)
+        return self.fault_bits != 0
 
     def is_temperature_warning(self):
         return self.temperature > TEMPERATURE_WARNING_THRESHOLD
 
-    def get_display_color(self):
+    def refresh_display_category(self):
         if self.has_any_fault():
-            return THEME_ERROR
-        if self.is_temperature_warning():
-            return THEME_WARNING
-        if self.mode == "AUTO":
-            return THEME_AUTO
-        return THEME_MANUAL
+            self.display_category = 'fault'
+        elif self.is_temperature_warning():
+            self.display_category = 'warning'
+        elif self.mode == "AUTO":
+            self.display_category = 'auto'
+        else:
+            self.display_category = 'manual'
+
+
+TRUCK_COLOR_BY_CATEGORY = {
+    'fault': THEME_ERROR,
+    'warning': THEME_WARNING,
+    'auto': THEME_AUTO,
+    'manual': THEME_MANUAL,
+}
+
+
+TRUCK_TOPIC_HANDLERS = {
+    'sensors': TruckData.update_sensors,
+    'state': TruckData.update_state,
+    'commands': TruckData.update_commands,
+}
 
 
 class MineManagementGUI:
@@ -142,21 +242,45 @@ class MineManagementGUI:
         self.root.configure(bg=THEME_BG)
 
         self.trucks = {}
+        self.sorted_truck_ids = []
+        self.truck_id_labels = []
         self.selected_truck = None
+        self.selected_command_topic = None
+        self.selected_setpoint_topic = None
         self.target_waypoint = None
 
         self.last_info_text = ""
+        self.last_info_signature = None
+        self.last_info_draw_time = 0.0
+        self.last_dashboard_values = (None, None)
+        self.scene_dirty = True
         self.waypoint_dirty = False
-        self.frame_times = deque(maxlen=30)
+        self.last_frame_time = time.monotonic()
         self.fps = 0.0
+        self.last_fps_shown = -1
 
         self.mqtt_client = None
         self.mqtt_connected = False
 
-        self.canvas_items = {}
+        self.body_ids = {}
+        self.direction_ids = {}
+        self.trail_ids = {}
+        self.label_ids = {}
+        self.body_last = {}
+        self.direction_last = {}
+        self.label_last = {}
+        self.free_truck_items = []
         self.waypoint_item_ids = None
+        self.last_waypoint_drawn = None
+        self.mqtt_message_queue = deque(maxlen=MQTT_QUEUE_MAX_MESSAGES)
+        self.truck_list_stale = False
+        self.pending_canvas_commands = []
+        self.queue_canvas_update = self.pending_canvas_commands.append
 
-        self.last_key_time = 0
+        self.last_manual_publish_time = 0.0
+        self.heartbeat_after_id = None
+        self.pending_manual_command = {}
+        self.manual_flush_after_id = None
 
         self.setup_styles()
         self.setup_gui()
@@ -165,7 +289,7 @@ class MineManagementGUI:
             self.setup_mqtt()
 
         self.update_gui()
-        self.check_heartbeat()
+        self.update_status_labels()
 
     def setup_styles(self):
         style = ttk.Style()
@@ -256,6 +380,10 @@ class MineManagementGUI:
                                bg='#050608', highlightthickness=1, highlightbackground=THEME_ACCENT)
         self.canvas.pack(padx=5, pady=5)
         self.canvas.bind('<Button-1>', self.on_map_click)
+        self.canvas_tcl_path = str(self.canvas)
+        self.canvas_eval = self.canvas.tk.eval
+        self.canvas_cull_max_x = canvas_width + CANVAS_CULL_MARGIN_PIXELS
+        self.canvas_cull_max_y = canvas_height + CANVAS_CULL_MARGIN_PIXELS
 
         self.draw_grid()
 
@@ -321,11 +449,15 @@ class MineManagementGUI:
         coord_frame.pack(fill=tk.X, pady=(0, 8))
 
         ttk.Label(coord_frame, text="X:", font=(FONT_NAME, 9)).grid(row=0, column=0, padx=(0, 5))
-        self.waypoint_x = ttk.Entry(coord_frame, width=10, font=(FONT_NAME, 9))
+        self.waypoint_x_var = tk.IntVar()
+        self.waypoint_x = ttk.Entry(coord_frame, width=10, font=(FONT_NAME, 9),
+                                    textvariable=self.waypoint_x_var)
         self.waypoint_x.grid(row=0, column=1, padx=(0, 10))
 
         ttk.Label(coord_frame, text="Y:", font=(FONT_NAME, 9)).grid(row=0, column=2, padx=(0, 5))
-        self.waypoint_y = ttk.Entry(coord_frame, width=10, font=(FONT_NAME, 9))
+        self.waypoint_y_var = tk.IntVar()
+        self.waypoint_y = ttk.Entry(coord_frame, width=10, font=(FONT_NAME, 9),
+                                    textvariable=self.waypoint_y_var)
         self.waypoint_y.grid(row=0, column=3)
 
         ttk.Button(control_frame, text="Send Waypoint", command=self.send_waypoint, style='Accent.TButton').pack(fill=tk.X, pady=(0, 10))
@@ -347,19 +479,31 @@ class MineManagementGUI:
         self.target_speed = 0
 
     def draw_grid(self):
-        grid_size = GRID_SPACING_PIXELS / MAP_DISPLAY_SCALE
+        grid_spacing = int(GRID_SPACING_PIXELS / MAP_DISPLAY_SCALE)
         canvas_width = int(MAP_WIDTH_PIXELS / MAP_DISPLAY_SCALE)
         canvas_height = int(MAP_HEIGHT_PIXELS / MAP_DISPLAY_SCALE)
+        dash_period = GRID_DASH_ON_PIXELS + GRID_DASH_OFF_PIXELS
 
-        for x in range(0, canvas_width, int(grid_size)):
-            self.canvas.create_line(x, 0, x, canvas_height, fill='#1f2833', width=1, dash=(2, 4))
+        image = tk.PhotoImage(width=canvas_width, height=canvas_height)
+        for x in range(0, canvas_width, grid_spacing):
+            for y in range(0, canvas_height, dash_period):
+                image.put(GRID_LINE_COLOR,
+                          to=(x, y, x + 1, min(y + GRID_DASH_ON_PIXELS, canvas_height)))
+        for y in range(0, canvas_height, grid_spacing):
+            for x in range(0, canvas_width, dash_period):
+                image.put(GRID_LINE_COLOR,
+                          to=(x, y, min(x + GRID_DASH_ON_PIXELS, canvas_width), y + 1))
 
-        for y in range(0, canvas_height, int(grid_size)):
-            self.canvas.create_line(0, y, canvas_width, y, fill='#1f2833', width=1, dash=(2, 4))
+        self.grid_background_image = image
+        self.canvas.create_image(0, 0, anchor='nw', image=image, tags='grid')
 
     def setup_mqtt(self):
         try:
-            self.mqtt_client = mqtt.Client(client_id="mine_management")
+            self.mqtt_client = mqtt.Client(client_id="mine_management", clean_session=False)
+            self.mqtt_client.max_inflight_messages_set(200)
+            self.mqtt_client.max_queued_messages_set(0)
+            self.mqtt_client.reconnect_delay_set(min_delay=1, max_delay=30)
+            self.mqtt_client.on_socket_open = self.on_mqtt_socket_open
             self.mqtt_client.on_connect = self.on_mqtt_connect
             self.mqtt_client.on_message = self.on_mqtt_message
 
@@ -370,82 +514,126 @@ class MineManagementGUI:
             print(f"[MQTT] Connection failed: {e}")
             self.status_label.config(text=f"MQTT: Error", foreground=THEME_ERROR)
 
+    def on_mqtt_socket_open(self, client, userdata, sock):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
     def on_mqtt_connect(self, client, userdata, flags, rc):
         if rc == 0:
             self.mqtt_connected = True
             print("[MQTT] Connected successfully")
-            self.status_label.config(text="MQTT: Connected", foreground=THEME_SUCCESS)
+            self.root.after(0, self.show_mqtt_status, "MQTT: Connected", THEME_SUCCESS)
 
-            client.subscribe(MQTT_TOPIC_SENSORS)
-            client.subscribe(MQTT_TOPIC_STATE)
-            client.subscribe(MQTT_TOPIC_COMMANDS.format("+"))
+            client.subscribe([
+                (MQTT_TOPIC_SENSORS, 0),
+                (MQTT_TOPIC_STATE, 0),
+                (MQTT_TOPIC_COMMANDS.format("+"), 0),
+            ])
             print("[MQTT] Subscribed to truck topics (sensors, state, commands)")
         else:
             print(f"[MQTT] Connection failed with code {rc}")
-            self.status_label.config(text=f"MQTT: Failed ({rc})", foreground=THEME_ERROR)
+            self.root.after(0, self.show_mqtt_status, f"MQTT: Failed ({rc})", THEME_ERROR)
+
+    def show_mqtt_status(self, text, color):
+        self.status_label.config(text=text, foreground=color)
 
     def on_mqtt_message(self, client, userdata, msg):
         try:
-            topic_parts = msg.topic.split('/')
-            truck_id = int(topic_parts[1])
+            self.mqtt_message_queue.append((msg.topic, payload_loads(msg.payload)))
+        except Exception as e:
+            print(f"[MQTT] Error decoding message: {e}")
+
+    def drain_mqtt_queue(self):
+        queue = self.mqtt_message_queue
+        if not queue:
+            return False
+
+        latest_data_per_topic = {}
+        for _ in range(len(queue)):
+            topic, data = queue.popleft()
+            latest_data_per_topic[topic] = data
+
+        for topic, data in latest_data_per_topic.items():
+            self.apply_mqtt_data(topic, data)
+
+        if self.truck_list_stale:
+            self.refresh_truck_list()
+        return True
+
+    def apply_mqtt_data(self, topic, data):
+        try:
+            match = TRUCK_TOPIC_PATTERN.match(topic)
+            if not match:
+                return
+
+            truck_id_text, kind = match.groups()
+            truck_id = int(truck_id_text)
+            handler = TRUCK_TOPIC_HANDLERS[kind]
 
             if truck_id not in self.trucks:
                 self.trucks[truck_id] = TruckData(truck_id)
-                self.root.after_idle(self.update_truck_list)
-
-            data = json.loads(msg.payload.decode())
+                self.register_truck(truck_id)
 
-            if 'sensors' in msg.topic:
-                self.trucks[truck_id].update_sensors(data)
-            elif 'state' in msg.topic:
-                self.trucks[truck_id].update_state(data)
-            elif 'commands' in msg.topic:
-                self.trucks[truck_id].update_commands(data)
+            handler(self.trucks[truck_id], data)
+            self.mark_scene_dirty()
 
         except Exception as e:
             print(f"[MQTT] Error processing message: {e}")
 
-    def update_truck_list(self):
-        truck_ids = [f"Truck {tid}" for tid in sorted(self.trucks.keys())]
-        self.truck_combo['values'] = truck_ids
+    def mark_scene_dirty(self):
+        self.scene_dirty = True
+
+    def register_truck(self, truck_id):
+        insert_index = bisect.bisect_left(self.sorted_truck_ids, truck_id)
+        self.sorted_truck_ids.insert(insert_index, truck_id)
+        self.truck_id_labels.insert(insert_index, f"Truck {truck_id}")
+        self.truck_list_stale = True
 
-        if truck_ids and not self.truck_combo.get():
+    def refresh_truck_list(self):
+        self.truck_list_stale = False
+        self.truck_combo['values'] = self.truck_id_labels
+
+        if not self.truck_combo.get():
             self.truck_combo.current(0)
             self.on_truck_selected(None)
 
         self.truck_count_label.config(text=f"Trucks: {len(self.trucks)}")
+        self.mark_scene_dirty()
 
     def on_truck_selected(self, event):
         selection = self.truck_combo.get()
         if selection:
             truck_id = int(selection.split()[1])
             self.selected_truck = truck_id
+            self.selected_command_topic = MQTT_TOPIC_COMMANDS.format(truck_id)
+            self.selected_setpoint_topic = MQTT_TOPIC_SETPOINT.format(truck_id)
             self.last_info_text = ""
+            self.last_info_signature = None
             
             if truck_id in self.trucks:
                 self.target_speed = self.trucks[truck_id].acceleration
             else:
                 self.target_speed = 0
+            self.mark_scene_dirty()
+            self.schedule_heartbeat()
 
     def on_map_click(self, event):
         map_x = int(event.x * MAP_DISPLAY_SCALE)
         map_y = int(event.y * MAP_DISPLAY_SCALE)
 
-        self.waypoint_x.delete(0, tk.END)
-        self.waypoint_x.insert(0, str(map_x))
-        self.waypoint_y.delete(0, tk.END)
-        self.waypoint_y.insert(0, str(map_y))
+        self.waypoint_x_var.set(map_x)
+        self.waypoint_y_var.set(map_y)
 
         self.target_waypoint = (map_x, map_y)
         self.waypoint_dirty = True
+        self.mark_scene_dirty()
 
     def send_waypoint(self):
         if not self.selected_truck or not self.mqtt_connected:
             return
 
         try:
-            x = int(self.waypoint_x.get())
-            y = int(self.waypoint_y.get())
+            x = self.waypoint_x_var.get()
+            y = self.waypoint_y_var.get()
 
             setpoint_data = {
                 "target_x": x,
@@ -453,42 +641,37 @@ class MineManagementGUI:
                 "target_speed": DEFAULT_TARGET_SPEED
             }
 
-            topic = MQTT_TOPIC_SETPOINT.format(self.selected_truck)
-            payload = json.dumps(setpoint_data)
-            self.mqtt_client.publish(topic, payload)
+            payload = payload_dumps(setpoint_data)
+            self.mqtt_client.publish(self.selected_setpoint_topic, payload, qos=0, retain=False)
 
             self.target_waypoint = (x, y)
             self.waypoint_dirty = True
+            self.mark_scene_dirty()
             print(f"[Management] Sent waypoint ({x}, {y}) to Truck {self.selected_truck}")
 
-        except ValueError:
+        except tk.TclError:
             print("[Management] Invalid waypoint coordinates")
 
     def send_mode_command(self, automatic):
         if not self.selected_truck or not self.mqtt_connected:
             return
 
-        command_data = {
-            "auto_mode": automatic,
-            "manual_mode": not automatic
-        }
-
-        topic = MQTT_TOPIC_COMMANDS.format(self.selected_truck)
-        payload = json.dumps(command_data)
-        self.mqtt_client.publish(topic, payload)
+        payload = AUTO_MODE_COMMAND_PAYLOAD if automatic else MANUAL_MODE_COMMAND_PAYLOAD
+        self.mqtt_client.publish(self.selected_command_topic, payload, qos=0, retain=False)
 
         mode_str = "AUTOMATIC" if automatic else "MANUAL"
         print(f"[Management] Sent {mode_str} mode command to Truck {self.selected_truck}")
 
+        if automatic:
+            self.cancel_heartbeat()
+        else:
+            self.schedule_heartbeat()
+
     def send_rearm_command(self):
         if not self.selected_truck or not self.mqtt_connected:
             return
 
-        command_data = {"rearm": True}
-
-        topic = MQTT_TOPIC_COMMANDS.format(self.selected_truck)
-        payload = json.dumps(command_data)
-        self.mqtt_client.publish(topic, payload)
+        self.mqtt_client.publish(self.selected_command_topic, REARM_COMMAND_PAYLOAD, qos=0, retain=False)
 
         print(f"[Management] Sent REARM command to Truck {self.selected_truck}")
 
@@ -500,46 +683,54 @@ class MineManagementGUI:
         if not truck or truck.mode == "AUTO":
             return
 
-        self.last_key_time = time.time()
         key = event.keysym
         cmd_data = {}
 
-        if key == 'Up' or key == 'w':
-            self.target_speed = min(100, self.target_speed + 5)
-            cmd_data['accelerate'] = self.target_speed
-
-        elif key == 'Down' or key == 's':
-            self.target_speed = max(-100, self.target_speed - 5)
+        if key in KEY_SPEED_DELTAS:
+            self.target_speed = max(-100, min(100, self.target_speed + KEY_SPEED_DELTAS[key]))
             cmd_data['accelerate'] = self.target_speed
 
         elif key == 'space':
             self.target_speed = 0
             cmd_data['accelerate'] = 0
 
-        elif key == 'Left' or key == 'a':
-            cmd_data['steer_left'] = 5
-            cmd_data['accelerate'] = self.target_speed
-
-        elif key == 'Right' or key == 'd':
-            cmd_data['steer_right'] = 5
+        elif key in KEY_STEER_COMMANDS:
+            cmd_data[KEY_STEER_COMMANDS[key]] = MANUAL_STEER_STEP
             cmd_data['accelerate'] = self.target_speed
 
         if cmd_data:
-            self.send_manual_command(cmd_data)
+            self.pending_manual_command.update(cmd_data)
+            if self.manual_flush_after_id is None:
+                self.manual_flush_after_id = self.root.after(
+                    MANUAL_COMMAND_FLUSH_MS, self.flush_manual_command)
+            self.schedule_heartbeat()
+
+    def flush_manual_command(self):
+        self.manual_flush_after_id = None
+        if not self.pending_manual_command:
+            return
+        command = self.pending_manual_command
+        self.pending_manual_command = {}
+        self.send_manual_command(command)
 
     def send_manual_command(self, data):
         if not self.selected_truck:
             return
 
-        topic = MQTT_TOPIC_COMMANDS.format(self.selected_truck)
-        payload = json.dumps(data)
-        self.mqtt_client.publish(topic, payload)
+        payload = payload_dumps(data)
+        self.mqtt_client.publish(self.selected_command_topic, payload, qos=0, retain=False)
+        self.last_manual_publish_time = time.monotonic()
+
+    def flush_canvas_updates(self):
+        if self.pending_canvas_commands:
+            self.canvas_eval('\n'.join(self.pending_canvas_commands))
+            self.pending_canvas_commands.clear()
 
     def canvas_x(self, map_x):
-        return map_x / MAP_DISPLAY_SCALE
+        return int(map_x * MAP_DISPLAY_INVERSE_SCALE)
 
     def canvas_y(self, map_y):
-        return map_y / MAP_DISPLAY_SCALE
+        return int(map_y * MAP_DISPLAY_INVERSE_SCALE)
 
     def draw_waypoint(self):
         if not self.waypoint_dirty:
@@ -550,10 +741,15 @@ class MineManagementGUI:
                 self.canvas.delete(self.waypoint_item_ids['oval'])
                 self.canvas.delete(self.waypoint_item_ids['text'])
                 self.waypoint_item_ids = None
+                self.last_waypoint_drawn = None
             self.waypoint_dirty = False
             return
 
         wx, wy = self.target_waypoint
+        if self.waypoint_item_ids and (wx, wy) == self.last_waypoint_drawn:
+            self.waypoint_dirty = False
+            return
+
         cx = self.canvas_x(wx)
         cy = self.canvas_y(wy)
 
@@ -585,64 +781,76 @@ class MineManagementGUI:
                 cy + WAYPOINT_DISPLAY_RADIUS
             )
             self.canvas.coords(self.waypoint_item_ids['text'], cx, cy - 15)
-        
+
+        self.last_waypoint_drawn = (wx, wy)
         self.waypoint_dirty = False
 
-    def draw_truck_trail(self, truck, truck_items):
-        if len(truck.position_history) < 2:
-            if 'trail' in truck_items:
-                self.canvas.delete(truck_items['trail'])
-                del truck_items['trail']
+    def draw_truck_trail(self, truck):
+        if not truck.pos_changed:
             return
+        truck.pos_changed = False
+
+        trail_id = self.trail_ids.get(truck.id)
 
-        trail_coords = []
-        for px, py in truck.position_history:
-            trail_coords.extend([self.canvas_x(px), self.canvas_y(py)])
+        if len(truck.trail_canvas_coords) < 4:
+            if trail_id is not None:
+                self.canvas.delete(trail_id)
+                del self.trail_ids[truck.id]
+            return
 
-        if 'trail' not in truck_items:
-            trail_id = self.canvas.create_line(
-                *trail_coords,
+        if trail_id is None:
+            self.trail_ids[truck.id] = self.canvas.create_line(
+                *truck.trail_canvas_coords,
                 fill=THEME_ACCENT,
                 width=2,
                 smooth=True,
                 tags='trail'
             )
-            truck_items['trail'] = trail_id
         else:
-            self.canvas.coords(truck_items['trail'], *trail_coords)
+            flat_coords = ' '.join(map(str, truck.trail_canvas_coords))
+            self.queue_canvas_update(
+                f"{self.canvas_tcl_path} coords {trail_id} {flat_coords}")
 
-    def draw_truck_body(self, truck, truck_items, x, y):
-        color = truck.get_display_color()
+    def draw_truck_body(self, truck, x, y):
+        category = truck.display_category
+        body_id = self.body_ids.get(truck.id)
 
-        if 'body' not in truck_items:
-            body_id = self.canvas.create_rectangle(
+        if body_id is None:
+            self.body_ids[truck.id] = self.canvas.create_rectangle(
                 x - TRUCK_DISPLAY_SIZE,
                 y - TRUCK_DISPLAY_SIZE,
                 x + TRUCK_DISPLAY_SIZE,
                 y + TRUCK_DISPLAY_SIZE,
-                fill=color,
+                fill=TRUCK_COLOR_BY_CATEGORY[category],
                 outline='white',
                 width=2,
-                tags='truck'
-            )
-            truck_items['body'] = body_id
-        else:
-            self.canvas.coords(
-                truck_items['body'],
-                x - TRUCK_DISPLAY_SIZE,
-                y - TRUCK_DISPLAY_SIZE,
-                x + TRUCK_DISPLAY_SIZE,
-                y + TRUCK_DISPLAY_SIZE
+                tags=('truck', 'color_' + category)
             )
-            self.canvas.itemconfig(truck_items['body'], fill=color)
+            self.body_last[truck.id] = (x, y, category)
+            return
+
+        last_x, last_y, last_category = self.body_last[truck.id]
+        if (x, y) != (last_x, last_y):
+            self.queue_canvas_update(
+                f"{self.canvas_tcl_path} coords {body_id} "
+                f"{x - TRUCK_DISPLAY_SIZE} {y - TRUCK_DISPLAY_SIZE} "
+                f"{x + TRUCK_DISPLAY_SIZE} {y + TRUCK_DISPLAY_SIZE}")
+        if category != last_category:
+            self.queue_canvas_update(
+                f"{self.canvas_tcl_path} itemconfigure {body_id} "
+                f"-fill {TRUCK_COLOR_BY_CATEGORY[category]} -tags {{truck color_{category}}}")
+        self.body_last[truck.id] = (x, y, category)
+
+    def draw_truck_direction(self, truck, x, y):
+        if self.direction_last.get(truck.id) == (x, y, truck.angle):
+            return
 
-    def draw_truck_direction(self, truck, truck_items, x, y):
-        rad = math.radians(truck.angle)
-        end_x = x + DIRECTION_INDICATOR_LENGTH * math.cos(rad)
-        end_y = y + DIRECTION_INDICATOR_LENGTH * math.sin(rad)
+        end_x = x + DIRECTION_INDICATOR_LENGTH * truck.angle_cos
+        end_y = y + DIRECTION_INDICATOR_LENGTH * truck.angle_sin
+        direction_id = self.direction_ids.get(truck.id)
 
-        if 'direction' not in truck_items:
-            direction_id = self.canvas.create_line(
+        if direction_id is None:
+            self.direction_ids[truck.id] = self.canvas.create_line(
                 x, y, end_x, end_y,
                 fill=THEME_FG,
                 width=3,
@@ -650,90 +858,132 @@ class MineManagementGUI:
                 arrowshape=(8, 10, 4),
                 tags='truck'
             )
-            truck_items['direction'] = direction_id
         else:
-            self.canvas.coords(truck_items['direction'], x, y, end_x, end_y)
+            self.queue_canvas_update(
+                f"{self.canvas_tcl_path} coords {direction_id} {x} {y} {end_x} {end_y}")
+        self.direction_last[truck.id] = (x, y, truck.angle)
 
-    def draw_truck_label(self, truck, truck_items, x, y):
-        label_text = f"TRUCK {truck.id}"
-        if truck.arrived:
-            label_text += " ✓"
+    def draw_truck_label(self, truck, x, y):
+        label_text = truck.label_arrived if truck.arrived else truck.label_plain
+        label_id = self.label_ids.get(truck.id)
 
-        if 'label' not in truck_items:
-            label_id = self.canvas.create_text(
+        if label_id is None:
+            self.label_ids[truck.id] = self.canvas.create_text(
                 x, y - TRUCK_DISPLAY_SIZE - 12,
                 text=label_text,
                 fill=THEME_FG,
                 font=('Segoe UI', 9, 'bold'),
                 tags='truck'
             )
-            truck_items['label'] = label_id
-        else:
-            self.canvas.coords(truck_items['label'], x, y - TRUCK_DISPLAY_SIZE - 12)
-            self.canvas.itemconfig(truck_items['label'], text=label_text)
+            self.label_last[truck.id] = (x, y, label_text)
+            return
+
+        last_x, last_y, last_text = self.label_last[truck.id]
+        if (x, y) != (last_x, last_y):
+            self.queue_canvas_update(
+                f"{self.canvas_tcl_path} coords {label_id} {x} {y - TRUCK_DISPLAY_SIZE - 12}")
+        if label_text != last_text:
+            self.queue_canvas_update(
+                f"{self.canvas_tcl_path} itemconfigure {label_id} -text {{{label_text}}}")
+        self.label_last[truck.id] = (x, y, label_text)
 
     def draw_trucks(self):
         self.draw_waypoint()
 
-        current_truck_ids = set(self.trucks.keys())
-        cached_truck_ids = set(self.canvas_items.keys())
-
-        removed_trucks = cached_truck_ids - current_truck_ids
-        for truck_id in removed_trucks:
-            for item_id in self.canvas_items[truck_id].values():
-                self.canvas.delete(item_id)
-            del self.canvas_items[truck_id]
+        removed_trucks = self.body_ids.keys() - self.trucks.keys()
+        for truck_id in list(removed_trucks):
+            self.remove_truck_items(truck_id)
 
         for truck_id, truck in self.trucks.items():
-            if not truck.dirty and truck_id in self.canvas_items:
+            if not truck.dirty and truck_id in self.body_ids:
                 continue
 
-            if truck_id not in self.canvas_items:
-                self.canvas_items[truck_id] = {}
+            if truck_id not in self.body_ids and self.free_truck_items:
+                self.reuse_truck_items(truck_id)
 
-            truck_items = self.canvas_items[truck_id]
-            x = self.canvas_x(truck.position_x)
-            y = self.canvas_y(truck.position_y)
+            x = int(truck.position_x * MAP_DISPLAY_INVERSE_SCALE)
+            y = int(truck.position_y * MAP_DISPLAY_INVERSE_SCALE)
 
-            self.draw_truck_trail(truck, truck_items)
-            self.draw_truck_body(truck, truck_items, x, y)
-            self.draw_truck_direction(truck, truck_items, x, y)
-            self.draw_truck_label(truck, truck_items, x, y)
-            
-            truck.dirty = False
-
-    def format_truck_info(self, truck):
-        info = f"Truck {truck.id} Information\n"
-        info += "=" * 30 + "\n\n"
+            if not (-CANVAS_CULL_MARGIN_PIXELS <= x <= self.canvas_cull_max_x and
+                    -CANVAS_CULL_MARGIN_PIXELS <= y <= self.canvas_cull_max_y):
+                truck.dirty = False
+                continue
 
-        info += f"Position: ({truck.position_x}, {truck.position_y})\n"
-        info += f"Heading: {truck.angle}°\n"
-        info += f"Temperature: {truck.temperature}°C\n"
+            self.draw_truck_trail(truck)
+            self.draw_truck_body(truck, x, y)
+            self.draw_truck_direction(truck, x, y)
+            self.draw_truck_label(truck, x, y)
 
-        info += f"\n--- Status ---\n"
-        info += f"Mode: {truck.mode}\n"
-        info += f"Fault State: {'FAULT' if truck.fault_state else 'OK'}\n"
+            truck.dirty = False
 
-        info += f"\n--- Control ---\n"
-        info += f"Acceleration: {truck.acceleration}%\n"
-        info += f"Steering: {truck.steering}°\n"
-        info += f"Arrived: {'YES' if truck.arrived else 'NO'}\n"
+        self.flush_canvas_updates()
+
+    def truck_item_maps(self):
+        return (('trail', self.trail_ids), ('body', self.body_ids),
+                ('direction', self.direction_ids), ('label', self.label_ids))
+
+    def remove_truck_items(self, truck_id):
+        pooled = {}
+        for name, item_ids in self.truck_item_maps():
+            item_id = item_ids.pop(truck_id, None)
+            if item_id is not None:
+                self.canvas.itemconfigure(item_id, state='hidden')
+                pooled[name] = item_id
+        self.body_last.pop(truck_id, None)
+        self.direction_last.pop(truck_id, None)
+        self.label_last.pop(truck_id, None)
+        if pooled:
+            self.free_truck_items.append(pooled)
+
+    def reuse_truck_items(self, truck_id):
+        pooled = self.free_truck_items.pop()
+        for name, item_ids in self.truck_item_maps():
+            item_id = pooled.get(name)
+            if item_id is not None:
+                self.canvas.itemconfigure(item_id, state='normal')
+                item_ids[truck_id] = item_id
+        forced_redraw = (None, None, None)
+        self.body_last[truck_id] = forced_redraw
+        self.direction_last[truck_id] = forced_redraw
+        self.label_last[truck_id] = forced_redraw
 
-        info += f"\n--- Faults ---\n"
-        info += f"Electrical: {'FAULT' if truck.fault_electrical else 'OK'}\n"
-        info += f"Hydraulic: {'FAULT' if truck.fault_hydraulic else 'OK'}\n"
+    def format_truck_info(self, truck):
+        fault_state = 'FAULT' if truck.fault_state else 'OK'
+        fault_electrical = 'FAULT' if truck.fault_electrical else 'OK'
+        fault_hydraulic = 'FAULT' if truck.fault_hydraulic else 'OK'
+        arrived = 'YES' if truck.arrived else 'NO'
 
         if truck.temperature > TEMPERATURE_CRITICAL_THRESHOLD:
-            info += f"\n⚠ CRITICAL TEMPERATURE!\n"
+            temperature_alert = "\n⚠ CRITICAL TEMPERATURE!\n"
         elif truck.is_temperature_warning():
-            info += f"\n⚠ High temperature\n"
+            temperature_alert = "\n⚠ High temperature\n"
+        else:
+            temperature_alert = ""
 
         if truck.last_update:
-            age = (datetime.now() - truck.last_update).total_seconds()
-            info += f"\n--- Updates ---\n"
-            info += f"Last update: {age:.1f}s ago\n"
-
-        return info
+            age = time.monotonic() - truck.last_update
+            update_info = f"\n--- Updates ---\nLast update: {age:.1f}s ago\n"
+        else:
+            update_info = ""
+
+        return (
+            f"Truck {truck.id} Information\n"
+            "==============================\n\n"
+            f"Position: ({truck.position_x}, {truck.position_y})\n"
+            f"Heading: {truck.angle}°\n"
+            f"Temperature: {truck.temperature}°C\n"
+            "\n--- Status ---\n"
+            f"Mode: {truck.mode}\n"
+            f"Fault State: {fault_state}\n"
+            "\n--- Control ---\n"
+            f"Acceleration: {truck.acceleration}%\n"
+            f"Steering: {truck.steering}°\n"
+            f"Arrived: {arrived}\n"
+            "\n--- Faults ---\n"
+            f"Electrical: {fault_electrical}\n"
+            f"Hydraulic: {fault_hydraulic}\n"
+            f"{temperature_alert}{update_info}"
+        )
 
     def update_info_panel(self):
         if not self.selected_truck or self.selected_truck not in self.trucks:
@@ -744,17 +994,30 @@ class MineManagementGUI:
                 self.info_text.config(state='disabled')
                 self.last_info_text = "No truck selected"
                 
-                # Reset dashboard
-                if hasattr(self, 'lbl_velocity'):
+                if self.last_dashboard_values != (None, None):
+                    self.last_dashboard_values = (None, None)
                     self.lbl_velocity.config(text="-")
                     self.lbl_steering.config(text="-")
             return
 
         truck = self.trucks[self.selected_truck]
+
+        signature = (truck.position_x, truck.position_y, truck.angle,
+                     truck.temperature, truck.mode, truck.fault_state,
+                     truck.fault_electrical, truck.fault_hydraulic,
+                     truck.acceleration, truck.steering, truck.arrived)
+        now = time.monotonic()
+        if (signature == self.last_info_signature and
+                now - self.last_info_draw_time < INFO_PANEL_MIN_REDRAW_SECONDS):
+            return
+        self.last_info_signature = signature
+        self.last_info_draw_time = now
+
         new_info = self.format_truck_info(truck)
-        
-        # Update dashboard
-        if hasattr(self, 'lbl_velocity'):
+
+        dashboard_values = (truck.acceleration, truck.steering)
+        if dashboard_values != self.last_dashboard_values:
+            self.last_dashboard_values = dashboard_values
             self.lbl_velocity.config(text=f"{truck.acceleration}%")
             self.lbl_steering.config(text=f"{truck.steering}°")
 
@@ -766,23 +1029,38 @@ class MineManagementGUI:
             self.last_info_text = new_info
 
     def update_gui(self):
-        current_time = time.time()
-        self.frame_times.append(current_time)
+        drained_messages = self.drain_mqtt_queue()
+
+        current_time = time.monotonic()
+        frame_delta = current_time - self.last_frame_time
+        self.last_frame_time = current_time
 
-        if len(self.frame_times) >= 2:
-            time_span = self.frame_times[-1] - self.frame_times[0]
-            if time_span > 0:
-                self.fps = (len(self.frame_times) - 1) / time_span
-                self.fps_label.config(text=f"FPS: {self.fps:.1f}")
+        if frame_delta > 0:
+            self.fps = self.fps * FPS_SMOOTHING_FACTOR + (1.0 / frame_delta) * (1.0 - FPS_SMOOTHING_FACTOR)
+
+        scene_changed = (self.scene_dirty or self.waypoint_dirty or
+                         any(truck.dirty for truck in self.trucks.values()))
+        if scene_changed:
+            self.draw_trucks()
+            self.update_info_panel()
+            self.scene_dirty = False
+
+        next_period = GUI_UPDATE_PERIOD_MS if drained_messages or scene_changed else GUI_IDLE_PERIOD_MS
+        self.root.after(next_period, self.update_gui)
+
+    def update_status_labels(self):
+        fps_shown = int(self.fps)
+        if fps_shown != self.last_fps_shown:
+            self.last_fps_shown = fps_shown
+            self.fps_label.config(text=f"FPS: {self.fps:.1f}")
 
         if self.trucks:
-            now = datetime.now()
+            now = time.monotonic()
             total_age = 0
             count = 0
             for truck in self.trucks.values():
                 if truck.last_update:
-                    age = (now - truck.last_update).total_seconds()
-                    total_age += age
+                    total_age += now - truck.last_update
                     count += 1
             if count > 0:
                 avg_age = total_age / count
@@ -792,22 +1070,32 @@ class MineManagementGUI:
                     foreground=color
                 )
 
-        self.draw_trucks()
-        self.update_info_panel()
-        self.root.after(GUI_UPDATE_PERIOD_MS, self.update_gui)
-
-    def check_heartbeat(self):
-        # Send heartbeat command every 200ms if idle to prevent timeout
-        if self.selected_truck and self.mqtt_connected:
-            truck = self.trucks.get(self.selected_truck)
-            if truck and truck.mode == "MANUAL":
-                idle_time = time.time() - self.last_key_time
-                if idle_time > 0.3:  # Only send if no key press for 300ms
-                    # Send current target speed to keep alive
-                    # Don't send steering (it will default to 0 in C++)
-                    self.send_manual_command({'accelerate': self.target_speed})
-        
-        self.root.after(200, self.check_heartbeat)
+        self.root.after(STATUS_LABEL_PERIOD_MS, self.update_status_labels)
+
+    def heartbeat_needed(self):
+        if not self.selected_truck or not self.mqtt_connected:
+            return False
+        truck = self.trucks.get(self.selected_truck)
+        return truck is not None and truck.mode == "MANUAL"
+
+    def schedule_heartbeat(self):
+        self.cancel_heartbeat()
+        self.heartbeat_after_id = self.root.after(MANUAL_HEARTBEAT_PERIOD_MS, self.emit_heartbeat)
+
+    def cancel_heartbeat(self):
+        if self.heartbeat_after_id is not None:
+            self.root.after_cancel(self.heartbeat_after_id)
+            self.heartbeat_after_id = None
+
+    def emit_heartbeat(self):
+        self.heartbeat_after_id = None
+        if not self.selected_truck:
+            return
+        if self.heartbeat_needed():
+            seconds_since_publish = time.monotonic() - self.last_manual_publish_time
+            if seconds_since_publish >= MANUAL_PUBLISH_STALL_SECONDS:
+                self.send_manual_command({'accelerate': self.target_speed})
+        self.schedule_heartbeat()
 
     def on_closing(self):
         if self.mqtt_client:
@@ -4,7 +4,7 @@ import json
 import math
 import random
 import sys
-from datetime import datetime
+import time
 
 import pygame
 
@@ -14,6 +14,16 @@ except ImportError:
     print("Warning: paho-mqtt not installed. Install with: pip install paho-mqtt")
     mqtt = None
 
+try:
+    import orjson
+    payload_loads = orjson.loads
+    payload_dumps = orjson.dumps
+except ImportError:
+    payload_loads = json.loads
+
+    def payload_dumps(data):
+        return json.dumps(data).encode()
+
 WINDOW_WIDTH_PIXELS = 1300
 WINDOW_HEIGHT_PIXELS = 700
 MAP_WIDTH_PIXELS = 1000
@@ -60,23 +70,50 @@ SENSOR_NOISE_ANGLE = 1
 SENSOR_NOISE_TEMPERATURE = 2
 
 ANGLE_NORMALIZATION = 360
+HALF_TURN_DEGREES = 180
 MAX_TURN_RATE_DEGREES = 5.0
 
 GRID_SPACING_PIXELS = 100
 
-SENSOR_PUBLISH_FRAME_INTERVAL = 1
+GLOW_ALPHA = 40
+
+ARROW_HEAD_SIZE = 8
+ARROW_HEAD_ANGLE_RADIANS = math.radians(150)
+ARROW_HEAD_COS = math.cos(ARROW_HEAD_ANGLE_RADIANS)
+ARROW_HEAD_SIN = math.sin(ARROW_HEAD_ANGLE_RADIANS)
+
+SENSOR_PUBLISH_PERIOD_SECONDS = 0.05
+NANOSECONDS_PER_MILLISECOND = 1_000_000
 
 DEFAULT_TRUCK_ID = 1
 DEFAULT_TRUCK_X = 100
 DEFAULT_TRUCK_Y = 200
 
+CONTROL_HELP_LINES = (
+    "1, 2, 3 - Select Truck",
+    "E - Toggle Electrical Fault",
+    "H - Toggle Hydraulic Fault",
+    "T - Temperature +20°C",
+    "SPACE - Pause/Resume",
+    "ESC - Quit",
+)
+SIDEBAR_CARD_ALPHA = 200
+TEXT_CACHE_MAX_ENTRIES = 256
+
 
 class Truck:
+    rotated_image_cache = {}
+    glow_sprite_cache = {}
+
     def __init__(self, truck_id, x, y):
         self.id = truck_id
+        self.sensor_topic = MQTT_TOPIC_SENSORS.format(truck_id)
         self.x = float(x)
         self.y = float(y)
         self.angle = 0.0
+        self.angle_radians = 0.0
+        self.angle_cos = 1.0
+        self.angle_sin = 0.0
         self.velocity = 0.0
         self.acceleration = 0
         self.steering = 0
@@ -90,6 +127,20 @@ class Truck:
 
         self.width = TRUCK_WIDTH_PIXELS
         self.height = TRUCK_HEIGHT_PIXELS
+        half_width = self.width / 2
+        half_height = self.height / 2
+        self.base_corners = (
+            (-half_width, -half_height),
+            (half_width, -half_height),
+            (half_width, half_height),
+            (-half_width, half_height),
+        )
+        self.arrow_outline_points = (
+            (self.width * 0.6, 0.0),
+            (-self.width * 0.5, self.height * 0.5),
+            (-self.width * 0.3, 0.0),
+            (-self.width * 0.5, -self.height * 0.5),
+        )
         self.color = COLOR_MANUAL
         self.image = None
 
@@ -102,14 +153,10 @@ class Truck:
         self.velocity = max(-self.max_speed, min(self.max_speed, self.velocity))
 
     def normalize_angle_difference(self, target_angle):
-        angle_diff = target_angle - self.angle
-        while angle_diff > 180:
-            angle_diff -= ANGLE_NORMALIZATION
-        while angle_diff < -180:
-            angle_diff += ANGLE_NORMALIZATION
-        return angle_diff
+        return (target_angle - self.angle + HALF_TURN_DEGREES) % ANGLE_NORMALIZATION - HALF_TURN_DEGREES
 
     def update_steering(self):
+        previous_angle = self.angle
         angle_diff = self.normalize_angle_difference(self.steering)
 
         if abs(angle_diff) > MAX_TURN_RATE_DEGREES:
@@ -118,11 +165,17 @@ class Truck:
             self.angle = self.steering
 
         self.angle %= ANGLE_NORMALIZATION
+        if self.angle != previous_angle:
+            self.refresh_heading_trig()
+
+    def refresh_heading_trig(self):
+        self.angle_radians = math.radians(self.angle)
+        self.angle_cos = math.cos(self.angle_radians)
+        self.angle_sin = math.sin(self.angle_radians)
 
     def update_position(self):
-        rad = math.radians(self.angle)
-        self.x += self.velocity * math.cos(rad)
-        self.y += self.velocity * math.sin(rad)
+        self.x += self.velocity * self.angle_cos
+        self.y += self.velocity * self.angle_sin
 
         self.x = max(0, min(MAP_WIDTH_PIXELS, self.x))
         self.y = max(0, min(MAP_HEIGHT_PIXELS, self.y))
@@ -141,37 +194,25 @@ class Truck:
         self.update_position()
         self.update_temperature()
 
-    def get_sensor_data_with_noise(self):
+    def get_sensor_data_with_noise(self, timestamp_ms):
+        randrange = random.randrange
         return {
             "truck_id": self.id,
-            "position_x": int(self.x + random.uniform(-SENSOR_NOISE_POSITION, SENSOR_NOISE_POSITION)),
-            "position_y": int(self.y + random.uniform(-SENSOR_NOISE_POSITION, SENSOR_NOISE_POSITION)),
-            "angle_x": int(self.angle + random.uniform(-SENSOR_NOISE_ANGLE, SENSOR_NOISE_ANGLE)) % ANGLE_NORMALIZATION,
-            "temperature": int(self.temperature + random.uniform(-SENSOR_NOISE_TEMPERATURE, SENSOR_NOISE_TEMPERATURE)),
+            "position_x": int(self.x) + randrange(-SENSOR_NOISE_POSITION, SENSOR_NOISE_POSITION + 1),
+            "position_y": int(self.y) + randrange(-SENSOR_NOISE_POSITION, SENSOR_NOISE_POSITION + 1),
+            "angle_x": (int(self.angle) + randrange(-SENSOR_NOISE_ANGLE, SENSOR_NOISE_ANGLE + 1)) % ANGLE_NORMALIZATION,
+            "temperature": int(self.temperature) + randrange(-SENSOR_NOISE_TEMPERATURE, SENSOR_NOISE_TEMPERATURE + 1),
             "fault_electrical": self.fault_electrical,
             "fault_hydraulic": self.fault_hydraulic,
-            "timestamp": int(datetime.now().timestamp() * 1000),
+            "timestamp": timestamp_ms,
         }
 
     def calculate_rotated_corners(self):
-        rad = math.radians(self.angle)
-        cos_a = math.cos(rad)
-        sin_a = math.sin(rad)
-
-        corners = [
-            (-self.width / 2, -self.height / 2),
-            (self.width / 2, -self.height / 2),
-            (self.width / 2, self.height / 2),
-            (-self.width / 2, self.height / 2),
-        ]
+        cos_a = self.angle_cos
+        sin_a = self.angle_sin
 
-        rotated_corners = []
-        for px, py in corners:
-            rx = px * cos_a - py * sin_a
-            ry = px * sin_a + py * cos_a
-            rotated_corners.append((self.x + rx, self.y + ry))
-
-        return rotated_corners
+        return [(self.x + px * cos_a - py * sin_a, self.y + px * sin_a + py * cos_a)
+                for px, py in self.base_corners]
 
     def get_display_color(self):
         if self.fault_electrical or self.fault_hydraulic:
@@ -182,9 +223,34 @@ class Truck:
             return COLOR_WARNING
         return self.color
 
+    def get_glow_sprite(self, color):
+        degree_key = int(self.angle) % ANGLE_NORMALIZATION
+        cache_key = (color, degree_key)
+        glow = Truck.glow_sprite_cache.get(cache_key)
+        if glow is None:
+            rad = math.radians(degree_key)
+            cos_a = math.cos(rad)
+            sin_a = math.sin(rad)
+            glow = pygame.Surface((self.width * 2, self.height * 2), pygame.SRCALPHA)
+            glow_points = [(lx * cos_a - ly * sin_a + self.width,
+                            lx * sin_a + ly * cos_a + self.height)
+                           for lx, ly in self.arrow_outline_points]
+            pygame.draw.polygon(glow, (*color[:3], GLOW_ALPHA), glow_points)
+            Truck.glow_sprite_cache[cache_key] = glow
+        return glow
+
+    def get_rotated_image(self):
+        degree_key = int(round(self.angle)) % ANGLE_NORMALIZATION
+        cache_key = (id(self.image), degree_key)
+        rotated_image = Truck.rotated_image_cache.get(cache_key)
+        if rotated_image is None:
+            rotated_image = pygame.transform.rotozoom(self.image, -degree_key, 1.0).convert_alpha()
+            Truck.rotated_image_cache[cache_key] = rotated_image
+        return rotated_image
+
     def draw_body(self, screen):
         if self.image:
-            rotated_image = pygame.transform.rotozoom(self.image, -self.angle, 1.0)
+            rotated_image = self.get_rotated_image()
             rect = rotated_image.get_rect()
             rect.center = (self.x, self.y)
             screen.blit(rotated_image, rect)
@@ -193,62 +259,35 @@ class Truck:
             if status_color != self.color:
                 pygame.draw.rect(screen, status_color, rect, 4)
         else:
-            # Draw a futuristic arrow/triangle shape
             color = self.get_display_color()
-            rad = math.radians(self.angle)
-            cos_a = math.cos(rad)
-            sin_a = math.sin(rad)
-            
-            # Local coordinates for a sharp arrowhead shape
-            # Nose (front)
-            p1 = (self.width * 0.6, 0)
-            # Rear Right
-            p2 = (-self.width * 0.5, self.height * 0.5)
-            # Rear Center (indented)
-            p3 = (-self.width * 0.3, 0)
-            # Rear Left
-            p4 = (-self.width * 0.5, -self.height * 0.5)
+            cos_a = self.angle_cos
+            sin_a = self.angle_sin
             
-            points = [p1, p2, p3, p4]
-            rotated_points = []
-            
-            for lx, ly in points:
-                rx = lx * cos_a - ly * sin_a
-                ry = lx * sin_a + ly * cos_a
-                rotated_points.append((self.x + rx, self.y + ry))
+            rotated_points = [(self.x + lx * cos_a - ly * sin_a, self.y + lx * sin_a + ly * cos_a)
+                              for lx, ly in self.arrow_outline_points]
 
             pygame.draw.polygon(screen, color, rotated_points)
             pygame.draw.polygon(screen, COLOR_BG, rotated_points, 2)  # Inner dark outline
 
-            # Add a "core" glow or engine light
             engine_pos = (self.x - self.width * 0.3 * cos_a, self.y - self.width * 0.3 * sin_a)
             pygame.draw.circle(screen, COLOR_TEXT, engine_pos, 3)
 
-            # Outer glow
-            glow_surface = pygame.Surface((self.width * 2, self.height * 2), pygame.SRCALPHA)
-            glow_rect = glow_surface.get_rect(center=(self.width, self.height))
-            
-            # Offset points for glow surface
-            glow_points = [(x - self.x + self.width, y - self.y + self.height) for x, y in rotated_points]
-            
-            pygame.draw.polygon(glow_surface, (*color[:3], 40), glow_points)
-            screen.blit(glow_surface, (self.x - self.width, self.y - self.height))
+            screen.blit(self.get_glow_sprite(color), (self.x - self.width, self.y - self.height))
 
     def draw_direction_indicator(self, screen):
-        rad = math.radians(self.angle)
-        end_x = self.x + TRUCK_DIRECTION_LINE_LENGTH * math.cos(rad)
-        end_y = self.y + TRUCK_DIRECTION_LINE_LENGTH * math.sin(rad)
-
-        mid_x = self.x + (TRUCK_DIRECTION_LINE_LENGTH * 0.7) * math.cos(rad)
-        mid_y = self.y + (TRUCK_DIRECTION_LINE_LENGTH * 0.7) * math.sin(rad)
+        cos_a = self.angle_cos
+        sin_a = self.angle_sin
+        end_x = self.x + TRUCK_DIRECTION_LINE_LENGTH * cos_a
+        end_y = self.y + TRUCK_DIRECTION_LINE_LENGTH * sin_a
 
         pygame.draw.line(screen, COLOR_TEXT, (self.x, self.y), (end_x, end_y), 4)
 
-        arrow_size = 8
-        arrow_angle_1 = rad + math.radians(150)
-        arrow_angle_2 = rad - math.radians(150)
-        arrow_p1 = (end_x + arrow_size * math.cos(arrow_angle_1), end_y + arrow_size * math.sin(arrow_angle_1))
-        arrow_p2 = (end_x + arrow_size * math.cos(arrow_angle_2), end_y + arrow_size * math.sin(arrow_angle_2))
+        head_cos_1 = cos_a * ARROW_HEAD_COS - sin_a * ARROW_HEAD_SIN
+        head_sin_1 = sin_a * ARROW_HEAD_COS + cos_a * ARROW_HEAD_SIN
+        head_cos_2 = cos_a * ARROW_HEAD_COS + sin_a * ARROW_HEAD_SIN
+        head_sin_2 = sin_a * ARROW_HEAD_COS - cos_a * ARROW_HEAD_SIN
+        arrow_p1 = (end_x + ARROW_HEAD_SIZE * head_cos_1, end_y + ARROW_HEAD_SIZE * head_sin_1)
+        arrow_p2 = (end_x + ARROW_HEAD_SIZE * head_cos_2, end_y + ARROW_HEAD_SIZE * head_sin_2)
         pygame.draw.polygon(screen, COLOR_TEXT, [(end_x, end_y), arrow_p1, arrow_p2])
 
     def draw_label(self, screen):
@@ -265,11 +304,18 @@ class Truck:
         self.draw_label(screen)
 
 
+FONT_CACHE = {}
+
+
 def get_safe_font(size, bold=False):
+    cache_key = (size, bold)
+    cached_font = FONT_CACHE.get(cache_key)
+    if cached_font is not None:
+        return cached_font
+
     font_names = ['segoeui', 'helveticaneue', 'arial', 'liberationsans', 'dejavusans']
     font_obj = None
-    
-    # Try to find a matching system font
+
     for name in font_names:
         font_path = pygame.font.match_font(name, bold=bold)
         if font_path:
@@ -278,23 +324,34 @@ def get_safe_font(size, bold=False):
                 break
             except:
                 continue
-                
-    # Fallback to default if no specific font found or error
+
     if font_obj is None:
         font_obj = pygame.font.SysFont(None, size, bold=bold)
-        
+
+    FONT_CACHE[cache_key] = font_obj
     return font_obj
 
+
+def build_text_card(text_surface, padding_x, padding_y, border_radius):
+    card = pygame.Surface((text_surface.get_width() + padding_x,
+                           text_surface.get_height() + padding_y), pygame.SRCALPHA)
+    pygame.draw.rect(card, (*COLOR_SURFACE, SIDEBAR_CARD_ALPHA), card.get_rect(),
+                     border_radius=border_radius)
+    card.blit(text_surface, (padding_x // 2, padding_y // 2))
+    return card
+
 class MineSimulation:
     def __init__(self):
         pygame.init()
         self.screen = pygame.display.set_mode((WINDOW_WIDTH_PIXELS, WINDOW_HEIGHT_PIXELS))
         pygame.display.set_caption("Mine Simulation System")
         self.map_surface = pygame.Surface((MAP_WIDTH_PIXELS, MAP_HEIGHT_PIXELS))
+        self.map_background = self.build_map_background()
         self.clock = pygame.time.Clock()
         
         self.font = get_safe_font(24, bold=True)
         self.small_font = get_safe_font(20)
+        self.build_static_sidebar_surfaces()
 
         self.trucks = {
             1: Truck(1, 100, 200),
@@ -327,6 +384,40 @@ class MineSimulation:
         self.running = True
         self.paused = False
 
+    def build_static_sidebar_surfaces(self):
+        title_font = get_safe_font(28, bold=True)
+        status_font = get_safe_font(20, bold=True)
+        mqtt_font = get_safe_font(16, bold=True)
+        controls_title_font = get_safe_font(16, bold=True)
+        control_font = get_safe_font(13)
+
+        self.title_card = build_text_card(
+            title_font.render("MINE SIMULATION", True, COLOR_ACCENT), 20, 10, 6)
+        self.status_cards = {
+            True: build_text_card(status_font.render("● PAUSED", True, COLOR_WARNING), 16, 8, 5),
+            False: build_text_card(status_font.render("● RUNNING", True, COLOR_SUCCESS), 16, 8, 5),
+        }
+        self.mqtt_status_cards = {
+            True: build_text_card(mqtt_font.render("MQTT: Connected", True, COLOR_SUCCESS), 16, 8, 5),
+            False: build_text_card(mqtt_font.render("MQTT: Disconnected", True, COLOR_ERROR), 16, 8, 5),
+        }
+        self.controls_title_surface = controls_title_font.render("CONTROLS", True, COLOR_ACCENT)
+        self.control_line_surfaces = [control_font.render(line, True, COLOR_TEXT)
+                                      for line in CONTROL_HELP_LINES]
+        self.text_cache = {}
+        self.sidebar_surface = pygame.Surface((SIDEBAR_WIDTH, WINDOW_HEIGHT_PIXELS)).convert()
+        self.sidebar_state_signature = None
+
+    def render_cached_text(self, font, text, color):
+        cache_key = (id(font), text, color)
+        surface = self.text_cache.get(cache_key)
+        if surface is None:
+            if len(self.text_cache) >= TEXT_CACHE_MAX_ENTRIES:
+                self.text_cache.pop(next(iter(self.text_cache)))
+            surface = font.render(text, True, color)
+            self.text_cache[cache_key] = surface
+        return surface
+
     def setup_mqtt(self):
         try:
             self.mqtt_client = mqtt.Client(client_id="mine_simulation")
@@ -358,7 +449,7 @@ class MineSimulation:
             truck_id = int(topic_parts[1])
 
             if truck_id in self.trucks:
-                command = json.loads(msg.payload.decode())
+                command = payload_loads(msg.payload)
                 truck = self.trucks[truck_id]
 
                 if "acceleration" in command:
@@ -373,11 +464,10 @@ class MineSimulation:
         if not self.mqtt_connected or not self.mqtt_client:
             return
 
+        publish = self.mqtt_client.publish
+        timestamp_ms = time.time_ns() // NANOSECONDS_PER_MILLISECOND
         for truck in self.trucks.values():
-            sensor_data = truck.get_sensor_data_with_noise()
-            topic = MQTT_TOPIC_SENSORS.format(truck.id)
-            payload = json.dumps(sensor_data)
-            self.mqtt_client.publish(topic, payload)
+            publish(truck.sensor_topic, payload_dumps(truck.get_sensor_data_with_noise(timestamp_ms)))
 
     def toggle_electrical_fault(self):
         if self.selected_truck_id in self.trucks:
@@ -425,46 +515,32 @@ class MineSimulation:
             for truck in self.trucks.values():
                 truck.update_physics()
 
-    def draw_grid(self):
+    def build_map_background(self):
+        background = pygame.Surface((MAP_WIDTH_PIXELS, MAP_HEIGHT_PIXELS)).convert()
+        background.fill(COLOR_BG)
         for x in range(0, MAP_WIDTH_PIXELS, GRID_SPACING_PIXELS):
-            pygame.draw.line(self.map_surface, COLOR_GRID, (x, 0), (x, MAP_HEIGHT_PIXELS), 1)
+            pygame.draw.line(background, COLOR_GRID, (x, 0), (x, MAP_HEIGHT_PIXELS), 1)
         for y in range(0, MAP_HEIGHT_PIXELS, GRID_SPACING_PIXELS):
-            pygame.draw.line(self.map_surface, COLOR_GRID, (0, y), (MAP_WIDTH_PIXELS, y), 1)
+            pygame.draw.line(background, COLOR_GRID, (0, y), (MAP_WIDTH_PIXELS, y), 1)
+        return background
 
     def draw_trucks(self):
         for truck in self.trucks.values():
             truck.draw(self.map_surface)
 
     def draw_title(self, y_offset):
-        title_font = get_safe_font(28, bold=True)
-        title = title_font.render("MINE SIMULATION", True, COLOR_ACCENT)
-        bg_surface = pygame.Surface((title.get_width() + 20, title.get_height() + 10), pygame.SRCALPHA)
-        pygame.draw.rect(bg_surface, (*COLOR_SURFACE, 200), bg_surface.get_rect(), border_radius=6)
-        bg_surface.blit(title, (10, 5))
-        self.screen.blit(bg_surface, (10, y_offset))
-        return y_offset + title.get_height() + 20
+        self.sidebar_surface.blit(self.title_card, (10, y_offset))
+        return y_offset + self.title_card.get_height() + 10
 
     def draw_status(self, y_offset):
-        status_text = "PAUSED" if self.paused else "RUNNING"
-        status_color = COLOR_WARNING if self.paused else COLOR_SUCCESS
-        status_font = get_safe_font(20, bold=True)
-        status = status_font.render(f"● {status_text}", True, status_color)
-        bg_surface = pygame.Surface((status.get_width() + 16, status.get_height() + 8), pygame.SRCALPHA)
-        pygame.draw.rect(bg_surface, (*COLOR_SURFACE, 200), bg_surface.get_rect(), border_radius=5)
-        bg_surface.blit(status, (8, 4))
-        self.screen.blit(bg_surface, (10, y_offset))
-        return y_offset + status.get_height() + 15
+        card = self.status_cards[self.paused]
+        self.sidebar_surface.blit(card, (10, y_offset))
+        return y_offset + card.get_height() + 7
 
     def draw_mqtt_status(self, y_offset):
-        mqtt_text = "Connected" if self.mqtt_connected else "Disconnected"
-        mqtt_color = COLOR_SUCCESS if self.mqtt_connected else COLOR_ERROR
-        mqtt_font = get_safe_font(16, bold=True)
-        mqtt_status = mqtt_font.render(f"MQTT: {mqtt_text}", True, mqtt_color)
-        bg_surface = pygame.Surface((mqtt_status.get_width() + 16, mqtt_status.get_height() + 8), pygame.SRCALPHA)
-        pygame.draw.rect(bg_surface, (*COLOR_SURFACE, 200), bg_surface.get_rect(), border_radius=5)
-        bg_surface.blit(mqtt_status, (8, 4))
-        self.screen.blit(bg_surface, (10, y_offset))
-        return y_offset + mqtt_status.get_height() + 15
+        card = self.mqtt_status_cards[self.mqtt_connected]
+        self.sidebar_surface.blit(card, (10, y_offset))
+        return y_offset + card.get_height() + 7
 
     def draw_truck_info(self, truck, y_offset, is_selected=False):
         info_font = get_safe_font(14, bold=True)
@@ -472,118 +548,100 @@ class MineSimulation:
 
         max_width = SIDEBAR_WIDTH - 20
         padding = 10
-        
-        # Determine content based on selection
+
+        has_fault = truck.fault_electrical or truck.fault_hydraulic
+        fault_value = 'YES' if has_fault else 'NO'
+        fault_color = COLOR_ERROR if has_fault else COLOR_SUCCESS
+
         if is_selected:
             bg_color = (*COLOR_SURFACE, 240)
             border_color = COLOR_ACCENT
             border_width = 2
-            
+
+            if truck.temperature > TEMPERATURE_CRITICAL_THRESHOLD:
+                temperature_color = COLOR_ERROR
+            elif truck.temperature > TEMPERATURE_WARNING_THRESHOLD:
+                temperature_color = COLOR_WARNING
+            else:
+                temperature_color = COLOR_TEXT
+
             info_data = [
-                (f"Position:", f"({int(truck.x)}, {int(truck.y)})", COLOR_TEXT),
-                (f"Heading:", f"{int(truck.angle)}°", COLOR_TEXT),
-                (f"Velocity:", f"{truck.velocity:.1f}", COLOR_SUCCESS if abs(truck.velocity) > 0 else COLOR_TEXT),
-                (f"Temperature:", f"{int(truck.temperature)}°C", COLOR_ERROR if truck.temperature > TEMPERATURE_CRITICAL_THRESHOLD else (COLOR_WARNING if truck.temperature > TEMPERATURE_WARNING_THRESHOLD else COLOR_TEXT)),
-                (f"Acceleration:", f"{truck.acceleration}%", COLOR_TEXT),
-                (f"Steering:", f"{truck.steering}°", COLOR_TEXT),
-                (f"Faults:", f"{'YES' if (truck.fault_electrical or truck.fault_hydraulic) else 'NO'}", COLOR_ERROR if (truck.fault_electrical or truck.fault_hydraulic) else COLOR_SUCCESS)
+                ("Position:", f"({int(truck.x)}, {int(truck.y)})", COLOR_TEXT),
+                ("Heading:", f"{int(truck.angle)}°", COLOR_TEXT),
+                ("Velocity:", f"{truck.velocity:.1f}", COLOR_SUCCESS if abs(truck.velocity) > 0 else COLOR_TEXT),
+                ("Temperature:", f"{int(truck.temperature)}°C", temperature_color),
+                ("Acceleration:", f"{truck.acceleration}%", COLOR_TEXT),
+                ("Steering:", f"{truck.steering}°", COLOR_TEXT),
+                ("Faults:", fault_value, fault_color)
             ]
         else:
             bg_color = (*COLOR_SURFACE, 180)
             border_color = (*COLOR_SURFACE_LIGHT, 100)
             border_width = 1
-            
-            # Compact view for unselected
+
             info_data = [
                 (f"Vel: {truck.velocity:.1f}", f"Temp: {int(truck.temperature)}°C", COLOR_TEXT),
-                (f"Faults:", f"{'YES' if (truck.fault_electrical or truck.fault_hydraulic) else 'NO'}", COLOR_ERROR if (truck.fault_electrical or truck.fault_hydraulic) else COLOR_SUCCESS)
+                ("Faults:", fault_value, fault_color)
             ]
 
-        # Calculate height
         header_height = 25
         row_height = 22
         total_height = header_height + (len(info_data) * row_height) + padding
-        
-        # Draw Card Background
+
         bg_surface = pygame.Surface((max_width, total_height), pygame.SRCALPHA)
         pygame.draw.rect(bg_surface, bg_color, bg_surface.get_rect(), border_radius=5)
-        
-        # Draw Border
+
         if is_selected:
             pygame.draw.rect(bg_surface, border_color, bg_surface.get_rect(), width=border_width, border_radius=5)
-        
-        self.screen.blit(bg_surface, (10, y_offset))
 
-        # Draw Title
+        self.sidebar_surface.blit(bg_surface, (10, y_offset))
+
         title_color = COLOR_ACCENT if is_selected else COLOR_TEXT
-        title = title_font.render(f"TRUCK {truck.id} {'[SELECTED]' if is_selected else ''}", True, title_color)
-        self.screen.blit(title, (20, y_offset + 5))
+        title = self.render_cached_text(
+            title_font, f"TRUCK {truck.id} {'[SELECTED]' if is_selected else ''}", title_color)
+        self.sidebar_surface.blit(title, (20, y_offset + 5))
 
-        # Draw Data
         local_y = header_height
         for label, value, color in info_data:
-            if is_selected:
-                # Key-Value pair
-                label_text = info_font.render(label, True, COLOR_TEXT)
-                value_text = info_font.render(value, True, color)
-                self.screen.blit(label_text, (20, y_offset + local_y))
-                self.screen.blit(value_text, (10 + max_width - value_text.get_width() - 10, y_offset + local_y))
-            else:
-                # Summary row (just text, simplified)
-                # Actually, let's keep the split if possible, or just render the text
-                # Logic above put 2 items in label/value tuple for compact view, let's render them left/right
-                t1 = info_font.render(label, True, COLOR_TEXT) # actually holding "Vel: ..."
-                t2 = info_font.render(value, True, color)      # actually holding "Temp: ..." or "YES/NO"
-                
-                self.screen.blit(t1, (20, y_offset + local_y))
-                self.screen.blit(t2, (10 + max_width - t2.get_width() - 10, y_offset + local_y))
-
+            label_text = self.render_cached_text(info_font, label, COLOR_TEXT)
+            value_text = self.render_cached_text(info_font, value, color)
+            self.sidebar_surface.blit(label_text, (20, y_offset + local_y))
+            self.sidebar_surface.blit(value_text, (10 + max_width - value_text.get_width() - 10, y_offset + local_y))
             local_y += row_height
         
         return y_offset + total_height + 10
 
     def draw_controls(self):
         y_offset = WINDOW_HEIGHT_PIXELS - 150
-        title_font = get_safe_font(16, bold=True)
-        control_font = get_safe_font(13)
-
-        title = title_font.render("CONTROLS", True, COLOR_ACCENT)
-        self.screen.blit(title, (15, y_offset))
-        y_offset += title.get_height() + 8
-
-        controls = [
-            "1, 2, 3 - Select Truck",
-            "E - Toggle Electrical Fault",
-            "H - Toggle Hydraulic Fault",
-            "T - Temperature +20°C",
-            "SPACE - Pause/Resume",
-            "ESC - Quit",
-        ]
+        self.sidebar_surface.blit(self.controls_title_surface, (15, y_offset))
+        y_offset += self.controls_title_surface.get_height() + 8
 
-        max_width = SIDEBAR_WIDTH - 20
-        for line in controls:
-            text = control_font.render(line, True, COLOR_TEXT)
-            # No background boxes for cleaner look in the new sidebar
-            self.screen.blit(text, (20, y_offset))
+        for text in self.control_line_surfaces:
+            self.sidebar_surface.blit(text, (20, y_offset))
             y_offset += text.get_height() + 5
 
-    def draw_ui(self):
-        # Draw Sidebar Background
-        sidebar_surface = pygame.Surface((SIDEBAR_WIDTH, WINDOW_HEIGHT_PIXELS))
-        sidebar_surface.fill(COLOR_BG) 
-        self.screen.blit(sidebar_surface, (0, 0))
-        
-        # Draw sidebar border line
-        pygame.draw.line(self.screen, COLOR_SURFACE_LIGHT, (SIDEBAR_WIDTH, 0), (SIDEBAR_WIDTH, WINDOW_HEIGHT_PIXELS), 2)
+    def compute_sidebar_state_signature(self):
+        return (
+            self.paused,
+            self.mqtt_connected,
+            self.selected_truck_id,
+            tuple((truck.id, int(truck.x), int(truck.y), int(truck.angle),
+                   round(truck.velocity, 1), int(truck.temperature),
+                   truck.acceleration, truck.steering,
+                   truck.fault_electrical, truck.fault_hydraulic)
+                  for truck in self.trucks.values()),
+        )
+
+    def render_sidebar(self):
+        self.sidebar_surface.fill(COLOR_BG)
 
         y_offset = 10
         y_offset = self.draw_title(y_offset)
         y_offset = self.draw_status(y_offset)
         y_offset = self.draw_mqtt_status(y_offset)
-        
-        # Divider
+
         y_offset += 10
-        pygame.draw.line(self.screen, COLOR_SURFACE_LIGHT, (20, y_offset), (SIDEBAR_WIDTH - 20, y_offset), 1)
+        pygame.draw.line(self.sidebar_surface, COLOR_SURFACE_LIGHT, (20, y_offset), (SIDEBAR_WIDTH - 20, y_offset), 1)
         y_offset += 20
 
         for truck_id in sorted(self.trucks.keys()):
@@ -593,13 +651,21 @@ class MineSimulation:
 
         self.draw_controls()
 
+    def draw_ui(self):
+        signature = self.compute_sidebar_state_signature()
+        if signature != self.sidebar_state_signature:
+            self.sidebar_state_signature = signature
+            self.render_sidebar()
+
+        self.screen.blit(self.sidebar_surface, (0, 0))
+        pygame.draw.line(self.screen, COLOR_SURFACE_LIGHT, (SIDEBAR_WIDTH, 0), (SIDEBAR_WIDTH, WINDOW_HEIGHT_PIXELS), 2)
+
     def draw(self):
         self.screen.fill(COLOR_BG)
-        self.map_surface.fill(COLOR_BG)
-        
-        self.draw_grid()
+        self.map_surface.blit(self.map_background, (0, 0))
+
         self.draw_trucks()
-        
+
         self.screen.blit(self.map_surface, (SIDEBAR_WIDTH, 0))
         self.draw_ui()
         
@@ -620,16 +686,17 @@ class MineSimulation:
     def run(self):
         self.print_startup_message()
 
-        frame_count = 0
+        next_publish_time = time.monotonic()
 
         while self.running:
             self.handle_events()
             self.update()
             self.draw()
 
-            frame_count += 1
-            if frame_count % SENSOR_PUBLISH_FRAME_INTERVAL == 0:
+            now = time.monotonic()
+            if now >= next_publish_time:
                 self.publish_sensor_data()
+                next_publish_time = now + SENSOR_PUBLISH_PERIOD_SECONDS
 
             self.clock.tick(SIMULATION_FPS)
 